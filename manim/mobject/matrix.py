@@ -39,13 +39,13 @@ __all__ = [
 ]
 
 
-import itertools as it
 from collections.abc import Callable, Iterable, Sequence
-from typing import Any
+from typing import Any, TypeVar
 
 import numpy as np
 from typing_extensions import Self
 
+from manim import config
 from manim.mobject.mobject import Mobject
 from manim.mobject.opengl.opengl_compatibility import ConvertToOpenGL
 from manim.mobject.text.numbers import DecimalNumber, Integer
@@ -54,19 +54,124 @@ from manim.mobject.text.tex_mobject import MathTex, Tex
 from ..constants import *
 from ..mobject.types.vectorized_mobject import VGroup, VMobject
 
+# Maps the key of a bracket TeX string (see :func:`_tex_cache_key`) to the created
+# (unstretched) bracket, so that matrices sharing a bracket configuration do not
+# recompile it.
+_BRACKET_CACHE: dict[tuple, MathTex] = {}
+# Maps the options and string of a MathTex matrix entry to the created mobject, so
+# that equal entries (within one matrix or across matrices) are only set up once.
+_ENTRY_CACHE: dict[tuple[tuple, str], Mobject] = {}
+# Maps the key of the fixed parts of ``get_det_text`` to the created mobject;
+# see :func:`_get_det_text_part`.
+_DET_TEXT_CACHE: dict[tuple, MathTex] = {}
+
+
+# The number of mobjects each of the caches above keeps at most.
+_TEX_CACHE_SIZE = 256
+
+MobjectT = TypeVar("MobjectT", bound=Mobject)
+
+
+def _get_cached_tex(
+    cache: dict[Any, MobjectT], key: Any, build: Callable[[], MobjectT]
+) -> MobjectT:
+    """Return a copy of the mobject stored under ``key`` in ``cache``.
+
+    On a miss the mobject is created by ``build``, evicting the least recently
+    used one if ``cache`` is full. A ``key`` of ``None`` bypasses the cache.
+    """
+    if key is None:
+        return build()
+    if key in cache:
+        # Reinsert the mobject, so that the dict stays ordered by last use.
+        mob = cache.pop(key)
+    else:
+        mob = build()
+        if len(cache) >= _TEX_CACHE_SIZE:
+            del cache[next(iter(cache))]
+    cache[key] = mob
+    return mob.copy()
+
+
+def _has_changed_defaults(mobject_class: type) -> bool:
+    """Return whether :meth:`~.Mobject.set_default` is in effect for ``mobject_class``
+    or one of its base classes.
+    """
+    for cls in mobject_class.__mro__:
+        # set_default() replaces the __init__ of the class it is called on.
+        original_init = vars(cls).get("_original__init__")
+        if original_init is not None and (
+            vars(cls).get("__init__", original_init) is not original_init
+        ):
+            return True
+    return False
+
+
+def _tex_cache_key(
+    tex_class: type[MathTex], *tex_strings: Any, **kwargs: Any
+) -> tuple | None:
+    """Return a key identifying ``tex_class(*tex_strings, **kwargs)``, or ``None``
+    if the created mobject cannot be cached.
+
+    Besides the arguments, the rendered mobject depends on the TeX template and
+    the renderer in use, so they are part of the key. Default values changed
+    with :meth:`~.Mobject.set_default` are not, so nothing is cached while they
+    are in effect. Neither is anything created from unhashable options (e.g.
+    numpy arrays).
+    """
+    if _has_changed_defaults(tex_class):
+        return None
+    tex_template = kwargs.pop("tex_template", config["tex_template"])
+    key = (
+        tex_class,
+        tex_strings,
+        tuple(sorted(kwargs.items())),
+        repr(tex_template),
+        config.renderer,
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _get_det_text_part(tex_class: type[MathTex], *tex_strings: str) -> MathTex:
+    """Return a copy of ``tex_class(*tex_strings)``, setting it up only on first use."""
+    return _get_cached_tex(
+        _DET_TEXT_CACHE,
+        _tex_cache_key(tex_class, *tex_strings),
+        lambda: tex_class(*tex_strings),
+    )
+
+
 # TO DO : The following two functions are not used in this file.
 #         Not sure if we should keep it or not.
 
 
 def matrix_to_tex_string(matrix: np.ndarray) -> str:
-    matrix = np.array(matrix).astype("str")
-    if matrix.ndim == 1:
-        matrix = matrix.reshape((matrix.size, 1))
-    n_rows, n_cols = matrix.shape
+    rows: Sequence[Sequence[str]] | np.ndarray
+    if (
+        isinstance(matrix, list)
+        and all(
+            isinstance(row, list) and all(isinstance(entry, str) for entry in row)
+            for row in matrix
+        )
+        and len({len(row) for row in matrix}) == 1
+    ):
+        # A rectangular list of TeX strings can be joined as it is, without
+        # copying every entry into a numpy string array first.
+        rows = matrix
+        n_cols = len(matrix[0])
+    else:
+        str_matrix = np.asarray(matrix).astype(str, copy=False)
+        if str_matrix.ndim == 1:
+            str_matrix = str_matrix.reshape((str_matrix.size, 1))
+        _, n_cols = str_matrix.shape
+        rows = str_matrix
     prefix = "\\left[ \\begin{array}{%s}" % ("c" * n_cols)
     suffix = "\\end{array} \\right]"
-    rows = [" & ".join(row) for row in matrix]
-    return prefix + " \\\\ ".join(rows) + suffix
+    return prefix + " \\\\ ".join(" & ".join(row) for row in rows) + suffix
 
 
 def matrix_to_mobject(matrix: np.ndarray) -> MathTex:
@@ -196,34 +301,80 @@ class Matrix(VMobject, metaclass=ConvertToOpenGL):
         super().__init__(**kwargs)
         mob_matrix = self._matrix_to_mob_matrix(matrix)
         self._organize_mob_matrix(mob_matrix)
-        self.elements = VGroup(*it.chain(*mob_matrix))
+        self.elements = VGroup(*[mob for row in mob_matrix for mob in row])
         self.add(self.elements)
         self._add_brackets(self.left_bracket, self.right_bracket, **bracket_config)
-        self.center()
+        # The brackets are placed symmetrically around the entries, so their outer
+        # edges determine the center without measuring the whole matrix again.
+        # An empty delimiter such as "." has no points to measure, though.
+        l_bracket, r_bracket = self.brackets
+        if len(l_bracket.get_all_points()) and len(r_bracket.get_all_points()):
+            self.shift(-(l_bracket.get_left() + r_bracket.get_right()) / 2)
+        else:
+            self.center()
         self.mob_matrix = mob_matrix
         if self.add_background_rectangles_to_entries:
-            for mob in self.elements:
-                mob.add_background_rectangle()
+            self.add_background_to_entries()
         if self.include_background_rectangle:
             self.add_background_rectangle()
 
+    @property
+    def mob_matrix(self) -> list[list[Mobject]]:
+        """The entries of the matrix, as a list of rows."""
+        return self._mob_matrix
+
+    @mob_matrix.setter
+    def mob_matrix(self, mob_matrix: list[list[Mobject]]) -> None:
+        self._mob_matrix = mob_matrix
+        # Anything replacing the entries must go through this setter, so that
+        # get_rows() and get_columns() do not return the previous entries.
+        self._rows: VGroup | None = None
+        self._columns: VGroup | None = None
+
     def _matrix_to_mob_matrix(self, matrix: np.ndarray) -> list[list[Mobject]]:
-        return [
-            [
-                self.element_to_mobject(item, **self.element_to_mobject_config)
-                for item in row
-            ]
-            for row in matrix
-        ]
+        if isinstance(matrix, np.ndarray) and (
+            matrix.dtype.kind in "biuUO" or matrix.dtype == np.float64
+        ):
+            # Iterating over an array yields a numpy view per row and a numpy
+            # scalar per entry; nested Python lists are built in a single call.
+            # Other dtypes keep their numpy scalars: tolist() would widen e.g.
+            # float32 to Python floats, changing str(0.1) to "0.10000000149011612".
+            matrix = matrix.tolist()
+        element_to_mobject = self.element_to_mobject
+        element_config = self.element_to_mobject_config
+
+        def make_element(item: Any) -> Mobject:
+            return element_to_mobject(item, **element_config)
+
+        options_key = None
+        if isinstance(element_to_mobject, type) and issubclass(
+            element_to_mobject, MathTex
+        ):
+            # The options are shared by all entries, so they are hashed only once.
+            options_key = _tex_cache_key(element_to_mobject, **element_config)
+        if options_key is not None:
+            # MathTex typesets ``str(item)``, so equal entries result in identical
+            # mobjects: set up every distinct entry once and copy it for repeats.
+            def make_compiled_element(item: Any) -> Mobject:
+                return _get_cached_tex(
+                    _ENTRY_CACHE, (options_key, str(item)), lambda: make_element(item)
+                )
+
+            return [[make_compiled_element(item) for item in row] for row in matrix]
+        return [[make_element(item) for item in row] for row in matrix]
 
     def _organize_mob_matrix(self, matrix: list[list[Mobject]]) -> Self:
+        n_rows = len(matrix)
+        n_cols = max((len(row) for row in matrix), default=0)
+        # positions[i, j] is the grid point of the element in row i and column j:
+        # rows go DOWN and columns go RIGHT, so only the x and y coordinates are set.
+        positions = np.zeros((n_rows, n_cols, 3))
+        positions[:, :, 0] = np.arange(n_cols) * self.h_buff
+        positions[:, :, 1] = np.arange(n_rows)[:, np.newaxis] * -self.v_buff
+        corner = self.element_alignment_corner
         for i, row in enumerate(matrix):
-            for j, _ in enumerate(row):
-                mob = matrix[i][j]
-                mob.move_to(
-                    i * self.v_buff * DOWN + j * self.h_buff * RIGHT,
-                    self.element_alignment_corner,
-                )
+            for j, mob in enumerate(row):
+                mob.move_to(positions[i, j], corner)
         return self
 
     def _add_brackets(self, left: str = "[", right: str = "]", **kwargs: Any) -> Self:
@@ -246,34 +397,26 @@ class Matrix(VMobject, metaclass=ConvertToOpenGL):
         # Height per row of LaTeX array with default settings
         BRACKET_HEIGHT = 0.5977
 
-        n = int((self.height) / BRACKET_HEIGHT) + 1
-        empty_tex_array = "".join(
-            [
-                r"\begin{array}{c}",
-                *n * [r"\quad \\"],
-                r"\end{array}",
-            ]
-        )
-        tex_left = "".join(
-            [
-                r"\left" + left,
-                empty_tex_array,
-                r"\right.",
-            ]
-        )
-        tex_right = "".join(
-            [
-                r"\left.",
-                empty_tex_array,
-                r"\right" + right,
-            ]
-        )
-        l_bracket = MathTex(tex_left, **kwargs)
-        r_bracket = MathTex(tex_right, **kwargs)
+        # Measuring the height walks over all points of the entries, so only do it once.
+        height = self.height
+        n = int(height / BRACKET_HEIGHT) + 1
+        empty_tex_array = r"\begin{array}{c}" + n * r"\quad \\" + r"\end{array}"
+        tex_left = r"\left" + left + empty_tex_array + r"\right."
+        tex_right = r"\left." + empty_tex_array + r"\right" + right
+
+        def make_bracket(tex_string: str) -> MathTex:
+            return _get_cached_tex(
+                _BRACKET_CACHE,
+                _tex_cache_key(MathTex, tex_string, **kwargs),
+                lambda: MathTex(tex_string, **kwargs),
+            )
+
+        l_bracket = make_bracket(tex_left)
+        r_bracket = make_bracket(tex_right)
 
         bracket_pair = VGroup(l_bracket, r_bracket)
         if self.stretch_brackets:
-            bracket_pair.stretch_to_fit_height(self.height + 2 * self.bracket_v_buff)
+            bracket_pair.stretch_to_fit_height(height + 2 * self.bracket_v_buff)
         l_bracket.next_to(self, LEFT, self.bracket_h_buff)
         r_bracket.next_to(self, RIGHT, self.bracket_h_buff)
         self.brackets = bracket_pair
@@ -300,12 +443,11 @@ class Matrix(VMobject, metaclass=ConvertToOpenGL):
                     m0.add(SurroundingRectangle(m0.get_columns()[1]))
                     self.add(m0)
         """
-        return VGroup(
-            *(
-                VGroup(*(row[i] for row in self.mob_matrix))
-                for i in range(len(self.mob_matrix[0]))
+        if self._columns is None:
+            self._columns = VGroup(
+                *(VGroup(*column) for column in zip(*self.mob_matrix))
             )
-        )
+        return self._columns
 
     def set_column_colors(self, *colors: str) -> Self:
         r"""Set individual colors for each columns of the matrix.
@@ -332,9 +474,9 @@ class Matrix(VMobject, metaclass=ConvertToOpenGL):
                     ).set_column_colors([RED,BLUE], GREEN)
                     self.add(m0)
         """
-        columns = self.get_columns()
-        for color, column in zip(colors, columns):
-            column.set_color(color)
+        for row in self.mob_matrix:
+            for color, mob in zip(colors, row):
+                mob.set_color(color)
         return self
 
     def get_rows(self) -> VGroup:
@@ -357,7 +499,9 @@ class Matrix(VMobject, metaclass=ConvertToOpenGL):
                     m0.add(SurroundingRectangle(m0.get_rows()[1]))
                     self.add(m0)
         """
-        return VGroup(*(VGroup(*row) for row in self.mob_matrix))
+        if self._rows is None:
+            self._rows = VGroup(*(VGroup(*row) for row in self.mob_matrix))
+        return self._rows
 
     def set_row_colors(self, *colors: str) -> Self:
         r"""Set individual colors for each row of the matrix.
@@ -384,9 +528,9 @@ class Matrix(VMobject, metaclass=ConvertToOpenGL):
                     ).set_row_colors([RED,BLUE], GREEN)
                     self.add(m0)
         """
-        rows = self.get_rows()
-        for color, row in zip(colors, rows):
-            row.set_color(color)
+        for color, row in zip(colors, self.mob_matrix):
+            for mob in row:
+                mob.set_color(color)
         return self
 
     def add_background_to_entries(self) -> Self:
@@ -398,7 +542,7 @@ class Matrix(VMobject, metaclass=ConvertToOpenGL):
         :class:`Matrix`
             The current matrix object (self).
         """
-        for mob in self.get_entries():
+        for mob in self.elements:
             mob.add_background_rectangle()
         return self
 
@@ -623,20 +767,22 @@ def get_det_text(
                 self.add(matrix)
                 self.add(det)
     """
-    parens = MathTex("(", ")")
-    parens.scale(initial_scale_factor)
-    parens.stretch_to_fit_height(matrix.height)
-    l_paren, r_paren = parens.split()
+    height = matrix.height
+    l_paren = _get_det_text_part(MathTex, "(")
+    r_paren = _get_det_text_part(MathTex, ")")
+    for paren in (l_paren, r_paren):
+        paren.scale(initial_scale_factor)
+        paren.stretch_to_fit_height(height)
     l_paren.next_to(matrix, LEFT, buff=0.1)
     r_paren.next_to(matrix, RIGHT, buff=0.1)
-    det = Tex("det")
+    det = _get_det_text_part(Tex, "det")
     det.scale(initial_scale_factor)
     det.next_to(l_paren, LEFT, buff=0.1)
     if background_rect:
         det.add_background_rectangle()
     det_text = VGroup(det, l_paren, r_paren)
     if determinant is not None:
-        eq = MathTex("=")
+        eq = _get_det_text_part(MathTex, "=")
         eq.next_to(r_paren, RIGHT, buff=0.1)
         result = MathTex(str(determinant))
         result.next_to(eq, RIGHT, buff=0.2)
@@ -921,9 +921,12 @@ FunctionOverride: TypeAlias = Callable
 :class:`~.Mobject`.
 """
 
-PathFuncType: TypeAlias = Callable[[Point3DLike, Point3DLike, float], Point3DLike]
-"""Function mapping two :class:`.Point3D` objects and an alpha value to a new
-:class:`.Point3D`.
+PathFuncType: TypeAlias = Callable[[Point3D_Array, Point3D_Array, float], Point3D_Array]
+"""Function mapping two :class:`.Point3D_Array` objects and an alpha value to a new
+:class:`.Point3D_Array`.
+
+The path functions created in :mod:`~.utils.paths` additionally accept an optional
+``out`` array to write the result into.
 """
 
 MappingFunction: TypeAlias = Callable[[Point3D], Point3D]
@@ -1,4 +1,10 @@
-"""Functions determining transformation paths between sets of points."""
+"""Functions determining transformation paths between sets of points.
+
+Besides the start points, end points and alpha, the path functions returned
+by :func:`straight_path`, :func:`path_along_arc`, :func:`path_along_circles`
+and :func:`spiral_path` accept an optional ``out`` array of the same shape to
+write the result into.
+"""
 
 from __future__ import annotations
 
@@ -7,16 +13,18 @@ __all__ = [
     "path_along_arc",
     "clockwise_path",
     "counterclockwise_path",
+    "batched_path",
 ]
 
 
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import numpy as np
 
 from ..constants import OUT
-from ..utils.bezier import interpolate
-from ..utils.space_ops import normalize, rotation_matrix
+from ..utils.space_ops import normalize, rotation_matrix_transpose
 
 if TYPE_CHECKING:
     from manim.typing import (
@@ -28,6 +36,65 @@ if TYPE_CHECKING:
 
 
 STRAIGHT_PATH_THRESHOLD = 0.01
+PATH_BLOCK_SIZE = 4096
+
+
+def _get_points_dtype(*points: Point3D_Array) -> np.dtype:
+    """Return the floating point dtype to compute a path between ``points`` in.
+
+    Float arrays keep their precision (e.g. float32 stays float32), other
+    arrays are computed in float64.
+    """
+    return np.result_type(*points, 1.0)
+
+
+def _copy_points(
+    points: Point3D_Array, out: Point3D_Array | None = None
+) -> Point3D_Array:
+    """Return a copy of ``points``, written into ``out`` if it is given."""
+    if out is None:
+        return np.array(points)
+    np.copyto(out, points)
+    return out
+
+
+def _apply_path_matrices(
+    start_points: Point3D_Array,
+    end_points: Point3D_Array,
+    start_matrix: np.ndarray,
+    end_matrix: np.ndarray,
+    out: Point3D_Array | None = None,
+) -> Point3D_Array:
+    """Return ``start_points @ start_matrix + end_points @ end_matrix``.
+
+    ``out`` may be one of the inputs. Large arrays are processed in blocks of
+    ``PATH_BLOCK_SIZE`` rows, so that the intermediate results of a block stay
+    in the CPU cache instead of making several passes over the whole array.
+    """
+    n_points = len(start_points)
+    if (
+        n_points <= PATH_BLOCK_SIZE
+        or np.ndim(start_points) != 2
+        or np.shape(start_points) != np.shape(end_points)
+    ):
+        # The end points are used first, so that ``out`` may be one of the inputs.
+        end_part = end_points @ end_matrix
+        points = np.matmul(start_points, start_matrix, out=out)
+        points += end_part
+        return points
+
+    if out is None:
+        dtype = np.result_type(start_points, end_points, start_matrix, end_matrix)
+        out = np.empty(np.shape(start_points), dtype=dtype)
+    end_part = np.empty((PATH_BLOCK_SIZE, out.shape[1]), dtype=out.dtype)
+    for i in range(0, n_points, PATH_BLOCK_SIZE):
+        block = slice(i, i + PATH_BLOCK_SIZE)
+        block_end_part = end_part[: len(out[block])]
+        # As above, each block of end points is used before it may be overwritten.
+        np.matmul(end_points[block], end_matrix, out=block_end_part)
+        np.matmul(start_points[block], start_matrix, out=out[block])
+        out[block] += block_end_part
+    return out
 
 
 def straight_path() -> PathFuncType:
@@ -73,7 +140,21 @@ def straight_path() -> PathFuncType:
                 self.wait()
 
     """
-    return interpolate
+
+    def path(
+        start_points: Point3D_Array,
+        end_points: Point3D_Array,
+        alpha: float,
+        out: Point3D_Array | None = None,
+    ) -> Point3D_Array:
+        # Same as interpolate(start_points, end_points, alpha), with one
+        # temporary array less and an optional output array.
+        end_part = np.multiply(end_points, alpha)
+        points = np.multiply(start_points, 1 - alpha, out=out)
+        points += end_part
+        return points
+
+    return path
 
 
 def path_along_circles(
@@ -138,19 +219,47 @@ def path_along_circles(
 
     """
     unit_axis = normalize(axis, fall_back=OUT)
+    detransform_matrix_transpose = rotation_matrix_transpose(-arc_angle, unit_axis)
+
+    # Relative to the centers, each point is the interpolation between its start
+    # and its end rotated back by arc_angle, rotated by alpha * arc_angle. For a
+    # given alpha this is linear in the start and end offsets:
+    #     start_offsets @ start_matrix + end_offsets @ end_matrix
+    # A path function is called for every submobject with the same few values of
+    # alpha in each frame, so the matrices for the latest ones are kept around.
+    @lru_cache(maxsize=10)
+    def get_path_matrices(
+        alpha: float, dtype: np.dtype
+    ) -> tuple[np.ndarray, np.ndarray]:
+        rot_matrix_transpose = rotation_matrix_transpose(alpha * arc_angle, unit_axis)
+        start_matrix = (1 - alpha) * rot_matrix_transpose
+        end_matrix = alpha * detransform_matrix_transpose @ rot_matrix_transpose
+        return (
+            np.ascontiguousarray(start_matrix, dtype=dtype),
+            np.ascontiguousarray(end_matrix, dtype=dtype),
+        )
 
     def path(
-        start_points: Point3D_Array, end_points: Point3D_Array, alpha: float
+        start_points: Point3D_Array,
+        end_points: Point3D_Array,
+        alpha: float,
+        out: Point3D_Array | None = None,
     ) -> Point3D_Array:
-        detransformed_end_points = circles_centers + np.dot(
-            end_points - circles_centers, rotation_matrix(-arc_angle, unit_axis).T
-        )
-        rot_matrix = rotation_matrix(alpha * arc_angle, unit_axis)
-        return circles_centers + np.dot(
-            interpolate(start_points, detransformed_end_points, alpha)
-            - circles_centers,
-            rot_matrix.T,
+        # The cached matrices are looked up by alpha, which must be hashable
+        # (e.g. not a 0-d array).
+        alpha = float(alpha)
+        if alpha == 0:
+            return _copy_points(start_points, out)
+        if alpha == 1:
+            return _copy_points(end_points, out)
+        dtype = _get_points_dtype(start_points, end_points)
+        centers = np.asarray(circles_centers, dtype=dtype)
+        start_matrix, end_matrix = get_path_matrices(alpha, dtype)
+        points = _apply_path_matrices(
+            start_points - centers, end_points - centers, start_matrix, end_matrix, out
         )
+        points += centers
+        return points
 
     return path
 
@@ -207,17 +316,70 @@ def path_along_arc(arc_angle: float, axis: Vector3DLike = OUT) -> PathFuncType:
     """
     if abs(arc_angle) < STRAIGHT_PATH_THRESHOLD:
         return straight_path()
-    unit_axis = normalize(axis, fall_back=OUT)
+    return _path_along_arc(float(arc_angle), tuple(float(coord) for coord in axis))
+
+
+# The path function only depends on the angle and the axis, so calls with the same
+# arguments share one, together with the matrices it has cached. The arguments are
+# passed as floats, so that e.g. 0-d arrays can be used as the angle.
+@lru_cache(maxsize=64)
+def _path_along_arc(arc_angle: float, axis: tuple[float, ...]) -> PathFuncType:
+    unit_axis = normalize(np.array(axis), fall_back=OUT)
+
+    # cross(axis, v) == v @ axis_cross_matrix for row vectors v
+    x, y, z = unit_axis
+    axis_cross_matrix = np.array(
+        [
+            [0, z, -y],
+            [-z, 0, x],
+            [y, -x, 0],
+        ]
+    )
+
+    # Each point moves around the center
+    #     center = (start + end) / 2 + cot(arc_angle / 2) * cross(axis, end - start) / 2
+    #            = start @ start_center_matrix + end @ end_center_matrix
+    # Unlike 1 / tan, cos / sin needs no special case for half circles: the
+    # cosine of a quarter turn makes the center offset vanish on its own.
+    half_angle_cot = np.cos(arc_angle / 2) / np.sin(arc_angle / 2)
+    center_cross_matrix = 0.5 * half_angle_cot * axis_cross_matrix
+    start_center_matrix = 0.5 * np.identity(3) - center_cross_matrix
+    end_center_matrix = 0.5 * np.identity(3) + center_cross_matrix
+
+    # Rotating around it, a point's position for a given alpha is affine in the
+    # start and end points as well:
+    #     start @ start_matrix + end @ end_matrix
+    @lru_cache(maxsize=10)
+    def get_path_matrices(
+        alpha: float, dtype: np.dtype
+    ) -> tuple[np.ndarray, np.ndarray]:
+        rot_matrix_transpose = rotation_matrix_transpose(alpha * arc_angle, unit_axis)
+        to_centers = np.identity(3) - rot_matrix_transpose
+        start_matrix = rot_matrix_transpose + start_center_matrix @ to_centers
+        end_matrix = end_center_matrix @ to_centers
+        return (
+            np.ascontiguousarray(start_matrix, dtype=dtype),
+            np.ascontiguousarray(end_matrix, dtype=dtype),
+        )
 
     def path(
-        start_points: Point3D_Array, end_points: Point3D_Array, alpha: float
+        start_points: Point3D_Array,
+        end_points: Point3D_Array,
+        alpha: float,
+        out: Point3D_Array | None = None,
     ) -> Point3D_Array:
-        vects = end_points - start_points
-        centers = start_points + 0.5 * vects
-        if arc_angle != np.pi:
-            centers += np.cross(unit_axis, vects / 2.0) / np.tan(arc_angle / 2)
-        rot_matrix = rotation_matrix(alpha * arc_angle, unit_axis)
-        return centers + np.dot(start_points - centers, rot_matrix.T)
+        alpha = float(alpha)
+        # Only the start is reached exactly: at alpha == 1 the points are not
+        # moved along the axis, so they only end up at the end points if those
+        # lie in the same plane perpendicular to the axis.
+        if alpha == 0:
+            return _copy_points(start_points, out)
+        start_matrix, end_matrix = get_path_matrices(
+            alpha, _get_points_dtype(start_points, end_points)
+        )
+        return _apply_path_matrices(
+            start_points, end_points, start_matrix, end_matrix, out
+        )
 
     return path
 
@@ -366,12 +528,83 @@ def spiral_path(angle: float, axis: Vector3DLike = OUT) -> PathFuncType:
     """
     if abs(angle) < STRAIGHT_PATH_THRESHOLD:
         return straight_path()
-    unit_axis = normalize(axis, fall_back=OUT)
+    return _spiral_path(float(angle), tuple(float(coord) for coord in axis))
+
+
+@lru_cache(maxsize=64)
+def _spiral_path(angle: float, axis: tuple[float, ...]) -> PathFuncType:
+    unit_axis = normalize(np.array(axis), fall_back=OUT)
+
+    # start + alpha * (end - start) @ rotation is affine in the start and end points
+    @lru_cache(maxsize=10)
+    def get_path_matrices(
+        alpha: float, dtype: np.dtype
+    ) -> tuple[np.ndarray, np.ndarray]:
+        end_matrix = alpha * rotation_matrix_transpose((alpha - 1) * angle, unit_axis)
+        start_matrix = np.identity(3) - end_matrix
+        return (
+            np.ascontiguousarray(start_matrix, dtype=dtype),
+            np.ascontiguousarray(end_matrix, dtype=dtype),
+        )
 
     def path(
-        start_points: Point3D_Array, end_points: Point3D_Array, alpha: float
+        start_points: Point3D_Array,
+        end_points: Point3D_Array,
+        alpha: float,
+        out: Point3D_Array | None = None,
     ) -> Point3D_Array:
-        rot_matrix = rotation_matrix((alpha - 1) * angle, unit_axis)
-        return start_points + alpha * np.dot(end_points - start_points, rot_matrix.T)
+        alpha = float(alpha)
+        if alpha == 0:
+            return _copy_points(start_points, out)
+        if alpha == 1:
+            return _copy_points(end_points, out)
+        start_matrix, end_matrix = get_path_matrices(
+            alpha, _get_points_dtype(start_points, end_points)
+        )
+        return _apply_path_matrices(
+            start_points, end_points, start_matrix, end_matrix, out
+        )
 
     return path
+
+
+def batched_path(
+    path_func: PathFuncType,
+    start_points_list: Sequence[Point3D_Array],
+    end_points_list: Sequence[Point3D_Array],
+    alpha: float,
+) -> list[Point3D_Array]:
+    """Apply a path function to several pairs of point arrays in a single call.
+
+    The point arrays are concatenated, passed to ``path_func`` once and split
+    up again, which saves the overhead of calling it for many small arrays,
+    e.g. for the submobjects of a :class:`~.VGroup` of dots.
+
+    Parameters
+    ----------
+    path_func
+        A path function that moves every point independently of the others,
+        like the ones returned by :func:`straight_path`, :func:`path_along_arc`
+        or :func:`spiral_path`. Functions depending on the number of points,
+        such as :func:`path_along_circles` with one center per point, cannot
+        be batched.
+    start_points_list
+        The start points of each array.
+    end_points_list
+        The end points of each array, with the same shapes as the start points.
+    alpha
+        The interpolation factor shared by all arrays.
+
+    Returns
+    -------
+    list[Point3D_Array]
+        The interpolated points of each array. They are views into a single
+        array holding all of the points.
+    """
+    if len(start_points_list) == 0:
+        return []
+    split_indices = np.cumsum([len(points) for points in start_points_list[:-1]])
+    points = path_func(
+        np.concatenate(start_points_list), np.concatenate(end_points_list), alpha
+    )
+    return np.split(points, split_indices)
@@ -3,13 +3,23 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
+from manim.constants import RendererType
 from manim.mobject.matrix import (
+    _BRACKET_CACHE,
+    _DET_TEXT_CACHE,
+    _ENTRY_CACHE,
+    _TEX_CACHE_SIZE,
     DecimalMatrix,
     IntegerMatrix,
     Matrix,
+    _get_cached_tex,
+    _tex_cache_key,
+    get_det_text,
 )
+from manim.mobject.mobject import Mobject
 from manim.mobject.text.tex_mobject import MathTex
 from manim.mobject.types.vectorized_mobject import VGroup
+from manim.utils.color import RED
 
 
 class TestMatrix:
@@ -164,6 +174,120 @@ class TestMatrix:
         with pytest.raises(expected_error):
             matrix.get_rows()[row][column]
 
+    def test_brackets_are_reused(self):
+        first = Matrix([[1, 2], [3, 4]])
+        cache_size = len(_BRACKET_CACHE)
+        second = Matrix([[5, 6], [7, 8]])
+
+        assert len(_BRACKET_CACHE) == cache_size
+        for first_bracket, second_bracket in zip(
+            first.get_brackets(), second.get_brackets()
+        ):
+            assert first_bracket is not second_bracket
+            assert first_bracket.tex_string == second_bracket.tex_string
+
+    def test_brackets_follow_changed_defaults(self):
+        Matrix([[1]])
+        MathTex.set_default(color=RED)
+        try:
+            matrix = Matrix([[1]])
+        finally:
+            MathTex.set_default()
+
+        for bracket in matrix.get_brackets():
+            assert bracket.get_color() == RED
+
+    def test_tex_cache_key(self, config):
+        assert _tex_cache_key(MathTex, "x", z_index=-1) != _tex_cache_key(
+            MathTex, "x", z_index=-2
+        )
+        assert _tex_cache_key(MathTex, "x", tex_environment=["align*"]) is None
+        assert RendererType.CAIRO in _tex_cache_key(MathTex, "x")
+
+    def test_repeated_entries_are_independent(self):
+        matrix = Matrix([[0, 1], [1, 0]])
+        entries = matrix.get_entries()
+
+        assert [entry.tex_string for entry in entries] == ["0", "1", "1", "0"]
+        assert len({id(entry) for entry in entries}) == 4
+        center = entries[2].get_center()
+        entries[1].shift(np.array([0.0, 1.0, 0.0]))
+        np.testing.assert_allclose(entries[2].get_center(), center)
+
+    def test_entries_are_reused_across_matrices(self):
+        Matrix([[1, 2], [3, 4]])
+        cache_size = len(_ENTRY_CACHE)
+        matrix = Matrix([[4, 3], [2, 1]])
+
+        assert len(_ENTRY_CACHE) == cache_size
+        assert [entry.tex_string for entry in matrix.get_entries()] == [
+            "4",
+            "3",
+            "2",
+            "1",
+        ]
+
+    def test_tex_caches_are_bounded(self):
+        cache = {}
+        for key in range(_TEX_CACHE_SIZE):
+            _get_cached_tex(cache, key, Mobject)
+        _get_cached_tex(cache, 0, Mobject)
+        _get_cached_tex(cache, _TEX_CACHE_SIZE, Mobject)
+
+        assert len(cache) == _TEX_CACHE_SIZE
+        assert 0 in cache
+        assert 1 not in cache
+
+    def test_rows_and_columns_are_cached(self):
+        matrix = Matrix([[1, 2], [3, 4]])
+
+        assert matrix.get_rows() is matrix.get_rows()
+        assert matrix.get_columns() is matrix.get_columns()
+
+        matrix.mob_matrix = [list(reversed(row)) for row in matrix.mob_matrix]
+        assert [entry.tex_string for entry in matrix.get_rows()[0]] == ["2", "1"]
+        assert [entry.tex_string for entry in matrix.get_columns()[0]] == ["2", "4"]
+
+    def test_set_colors_uses_current_entries(self):
+        matrix = Matrix([[1, 2], [3, 4]])
+        new_entry = MathTex("5")
+        matrix.get_mob_matrix()[0][0] = new_entry
+
+        matrix.set_column_colors(RED)
+        assert new_entry.get_color() == RED
+        assert matrix.get_mob_matrix()[1][0].get_color() == RED
+
+    def test_array_entries_match_list_entries(self):
+        matrix_elements = [[1, 2.5], [-3, 4]]
+        from_list = Matrix(matrix_elements)
+        from_array = Matrix(np.array(matrix_elements, dtype=object))
+
+        assert [entry.tex_string for entry in from_array.get_entries()] == [
+            entry.tex_string for entry in from_list.get_entries()
+        ]
+
+    @pytest.mark.parametrize("dtype", [np.float16, np.float32, np.float64])
+    def test_float_array_entries(self, dtype):
+        matrix = Matrix(np.array([[0.1, 2.5]], dtype=dtype))
+
+        assert [entry.tex_string for entry in matrix.get_entries()] == ["0.1", "2.5"]
+
+    @pytest.mark.parametrize(
+        ("matrix_elements", "left_bracket", "right_bracket"),
+        [
+            ([[1, 2], [3, 4]], "[", "]"),
+            ([[1, 22, 333]], "(", "]"),
+            ([[1], [2], [3]], "\\{", "\\}"),
+            ([[1, 2], [3, 4]], "\\{", "."),
+        ],
+    )
+    def test_matrix_is_centered(self, matrix_elements, left_bracket, right_bracket):
+        matrix = Matrix(
+            matrix_elements, left_bracket=left_bracket, right_bracket=right_bracket
+        )
+
+        np.testing.assert_allclose(matrix.get_center(), np.zeros(3), atol=1e-8)
+
 
 class TestDecimalMatrix:
     @pytest.mark.parametrize(
@@ -193,6 +317,18 @@ class TestDecimalMatrix:
                 assert element.number == expected_elements[row_index][column_index]
                 assert element.num_decimal_places == num_decimal_places
 
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_decimal_matrix_from_array(self, dtype):
+        matrix_elements = [[1.25, 5.5], [9.0, 3.75]]
+        matrix = DecimalMatrix(
+            np.array(matrix_elements, dtype=dtype),
+            element_to_mobject_config={"num_decimal_places": 2},
+        )
+
+        for row_index, row in enumerate(matrix.get_rows()):
+            for column_index, element in enumerate(row):
+                assert element.number == matrix_elements[row_index][column_index]
+
 
 class TestIntegerMatrix:
     @pytest.mark.parametrize(
@@ -210,3 +346,26 @@ class TestIntegerMatrix:
         for row_index, row in enumerate(matrix.get_rows()):
             for column_index, element in enumerate(row):
                 assert element.number == expected_elements[row_index][column_index]
+
+    def test_integer_matrix_from_array(self):
+        matrix = IntegerMatrix(np.array([[1, 2], [3, 4]]))
+
+        assert [element.number for element in matrix.get_entries()] == [1, 2, 3, 4]
+
+
+class TestGetDetText:
+    def test_det_text_parts_are_reused(self):
+        matrix = Matrix([[2, 0], [-1, 1]])
+        first = get_det_text(matrix, determinant=3)
+        cache_size = len(_DET_TEXT_CACHE)
+        second = get_det_text(matrix, determinant=3)
+
+        assert len(_DET_TEXT_CACHE) == cache_size
+        get_det_text(matrix, determinant=4)
+        assert len(_DET_TEXT_CACHE) == cache_size
+        assert len(second) == 5
+        for first_part, second_part in zip(first, second):
+            assert first_part is not second_part
+            np.testing.assert_allclose(
+                first_part.get_center(), second_part.get_center()
+            )
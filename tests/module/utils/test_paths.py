@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from manim.constants import DOWN, IN, LEFT, OUT, RIGHT, UP
+from manim.utils.paths import (
+    PATH_BLOCK_SIZE,
+    batched_path,
+    clockwise_path,
+    counterclockwise_path,
+    path_along_arc,
+    path_along_circles,
+    spiral_path,
+    straight_path,
+)
+from manim.utils.space_ops import rotation_matrix
+
+
+@pytest.fixture
+def points():
+    # Arc paths only move points within the plane perpendicular to their axis.
+    rng = np.random.default_rng(0)
+    start_points, end_points = rng.normal(size=(2, 20, 3))
+    start_points[:, 2] = end_points[:, 2] = 0
+    return start_points, end_points
+
+
+@pytest.mark.parametrize(
+    "path_func",
+    [
+        straight_path(),
+        path_along_arc(2.0),
+        path_along_arc(-1.0, IN),
+        clockwise_path(),
+        counterclockwise_path(),
+        spiral_path(4.0),
+        spiral_path(1.0, UP),
+    ],
+)
+def test_path_endpoints(path_func, points):
+    start_points, end_points = points
+    np.testing.assert_allclose(path_func(start_points, end_points, 0), start_points)
+    np.testing.assert_allclose(
+        path_func(start_points, end_points, 1), end_points, atol=1e-12
+    )
+
+
+@pytest.mark.parametrize("arc_angle", [2.0, -0.5, np.pi])
+@pytest.mark.parametrize("alpha", [0.25, 0.5, 0.8])
+def test_path_along_arc(arc_angle, alpha, points):
+    start_points, end_points = points
+    # Rotate every point around the center of its arc.
+    vects = end_points - start_points
+    centers = start_points + 0.5 * vects
+    if arc_angle != np.pi:
+        centers += np.cross(OUT, vects / 2.0) / np.tan(arc_angle / 2)
+    expected = centers + np.dot(
+        start_points - centers, rotation_matrix(alpha * arc_angle, OUT).T
+    )
+
+    np.testing.assert_allclose(
+        path_along_arc(arc_angle)(start_points, end_points, alpha), expected
+    )
+
+
+def test_counterclockwise_half_circle():
+    path = counterclockwise_path()
+    np.testing.assert_allclose(
+        path(np.array([LEFT]), np.array([RIGHT]), 0.5), np.array([DOWN]), atol=1e-12
+    )
+
+
+@pytest.mark.parametrize(
+    "path_func",
+    [
+        straight_path(),
+        path_along_arc(2.0),
+        path_along_circles(1.5, np.array([1.0, 2.0, 0.0])),
+        spiral_path(4.0),
+    ],
+)
+def test_path_out(path_func, points):
+    start_points, end_points = points
+    expected = path_func(start_points, end_points, 0.3)
+
+    out = np.empty_like(start_points)
+    assert path_func(start_points, end_points, 0.3, out=out) is out
+    np.testing.assert_allclose(out, expected)
+
+    # The result may also be written over the start points.
+    path_func(start_points, end_points, 0.3, out=start_points)
+    np.testing.assert_allclose(start_points, expected)
+
+
+@pytest.mark.parametrize(
+    "path_func",
+    [
+        path_along_arc(2.0),
+        path_along_circles(1.5, np.array([1.0, 2.0, 0.0])),
+        spiral_path(4.0),
+    ],
+)
+def test_path_large_arrays(path_func):
+    rng = np.random.default_rng(0)
+    start_points, end_points = rng.normal(size=(2, 2 * PATH_BLOCK_SIZE + 5, 3))
+    expected = np.concatenate(
+        [
+            path_func(start, end, 0.3)
+            for start, end in zip(
+                np.array_split(start_points, 5), np.array_split(end_points, 5)
+            )
+        ]
+    )
+
+    np.testing.assert_allclose(path_func(start_points, end_points, 0.3), expected)
+    path_func(start_points, end_points, 0.3, out=end_points)
+    np.testing.assert_allclose(end_points, expected)
+
+
+def test_path_endpoints_are_exact_copies(points):
+    start_points, end_points = points
+    arc_path = path_along_arc(2.0)
+    spiral = spiral_path(4.0)
+    circles_path = path_along_circles(1.5, np.array([1.0, 2.0, 0.0]))
+
+    for path_func in (arc_path, spiral, circles_path):
+        result = path_func(start_points, end_points, 0)
+        np.testing.assert_array_equal(result, start_points)
+        assert result is not start_points
+    for path_func in (spiral, circles_path):
+        result = path_func(start_points, end_points, 1)
+        np.testing.assert_array_equal(result, end_points)
+        assert result is not end_points
+
+
+@pytest.mark.parametrize(
+    "path_func",
+    [
+        path_along_arc(2.0),
+        path_along_circles(1.5, np.array([1.0, 2.0, 0.0])),
+        spiral_path(4.0),
+    ],
+)
+def test_path_keeps_float_dtype(path_func, points):
+    start_points, end_points = points
+    expected = path_func(start_points, end_points, np.float64(0.3))
+
+    result = path_func(
+        start_points.astype(np.float32), end_points.astype(np.float32), np.float64(0.3)
+    )
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-5)
+
+
+@pytest.mark.parametrize(
+    "path_func",
+    [
+        path_along_arc(2.0),
+        path_along_circles(1.5, np.array([1.0, 2.0, 0.0])),
+        spiral_path(4.0),
+    ],
+)
+def test_path_array_alpha(path_func, points):
+    start_points, end_points = points
+    for alpha in (0, 0.3, 1):
+        np.testing.assert_allclose(
+            path_func(start_points, end_points, np.array(alpha)),
+            path_func(start_points, end_points, alpha),
+        )
+
+
+def test_straight_path(points):
+    start_points, end_points = points
+    np.testing.assert_array_equal(
+        straight_path()(start_points, end_points, 0.3),
+        0.7 * start_points + 0.3 * end_points,
+    )
+
+
+@pytest.mark.parametrize(
+    "path_func", [straight_path(), path_along_arc(2.0), spiral_path(4.0)]
+)
+def test_batched_path(path_func, points):
+    start_points, end_points = points
+    sizes = [1, 4, 15]
+    start_points_list = np.split(start_points, np.cumsum(sizes[:-1]))
+    end_points_list = np.split(end_points, np.cumsum(sizes[:-1]))
+
+    results = batched_path(path_func, start_points_list, end_points_list, 0.3)
+
+    assert [len(result) for result in results] == sizes
+    for result, start, end in zip(results, start_points_list, end_points_list):
+        np.testing.assert_allclose(result, path_func(start, end, 0.3))
+    assert batched_path(path_func, [], [], 0.3) == []
+
+
+def test_path_functions_are_shared():
+    assert path_along_arc(2.0) is path_along_arc(2.0, OUT)
+    assert clockwise_path() is clockwise_path()
+    assert spiral_path(4.0, [0, 1, 0]) is spiral_path(4.0, UP)
+    assert path_along_arc(2.0) is not path_along_arc(2.0, IN)
+    assert path_along_arc(np.array(2.0), np.array(OUT)) is path_along_arc(2.0)
+    assert spiral_path(np.float32(4.0)) is spiral_path(4.0)